@@ -1,17 +1,23 @@
 import sys
 import os
+import stat
+import ctypes
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QVBoxLayout, QLabel,
-    QPushButton, QSizePolicy, QFileSystemModel, QTreeView, QListView,
+    QSizePolicy, QFileSystemModel, QTreeView, QListView,
     QSplitter, QLineEdit, QToolButton, QMenu, QAction, QMessageBox
 )
 from PyQt5.QtGui import (
     QPixmap, QIcon, QFont, QDesktopServices, QCursor, QDrag, 
-    QKeySequence, QPainter, QLinearGradient, QColor
+    QKeySequence, QPainter, QLinearGradient, QColor, QPixmapCache,
+    QImage
 )
-from PyQt5.QtCore import Qt, QSize, QUrl, QMimeData, QModelIndex
+from PyQt5.QtCore import Qt, QSize, QUrl, QMimeData, QModelIndex, QThread, pyqtSignal, QPoint, QDir
 
 # --- textures ---
 TEXTURE_DIR = os.path.join(os.path.dirname(__file__), "textures")
@@ -20,23 +26,71 @@ MINIMIZE_IMG = os.path.join(TEXTURE_DIR, "minimize.png")
 TITLEBAR_BG = os.path.join(TEXTURE_DIR, "titlebar_bg.png")  # New texture for title bar background
 BUTTON_SIZE = 32  # keeps original titlebar buttons 32px (titlebar). Content buttons will be 40px.
 
+# --- stylesheets (module-level so the strings are built once, not per window) ---
+CONTENT_CSS = """
+    QWidget {
+        border: 2px solid #535353;
+        background: qlineargradient(
+            x1: 0, y1: 0,
+            x2: 0, y2: 1,
+            stop: 0 #a8a8a8,   /* top color */
+            stop: 1 #6d6d6d    /* bottom color */
+        );
+    }
+    QToolButton[autoRaise="true"] {
+        background: transparent;
+        border: none;
+    }
+    QToolButton[autoRaise="true"]:hover {
+        background-color: rgba(255, 255, 255, 0.06); /* subtle hover highlight */
+        border-radius: 6px;
+    }
+"""
+
+TOOLTIP_CSS = """
+    QToolTip {
+        background-color: #333333;
+        color: white;
+        border: 1px solid #222222;
+        padding: 2px;
+        font-size: 11pt;
+        font-family: 'Noto Sans';
+    }
+"""
+
+# unscaled texture pixmaps, read from disk at most once per path (None if missing/unreadable)
+_RAW_PIXMAPS = {}
+
+def _get_raw(path):
+    """Return the unscaled QPixmap for path, loading it on first use; None if unavailable."""
+    if path not in _RAW_PIXMAPS:
+        pix = QPixmap(path) if os.path.exists(path) else None
+        _RAW_PIXMAPS[path] = pix if pix is not None and not pix.isNull() else None
+    return _RAW_PIXMAPS[path]
+
 # helper to load icons from user's texture folder without altering the textures
 def load_icon(path, size=None):
     """Return QIcon from path if exists; otherwise return None.
-    If size is provided, the pixmap will be scaled to that size."""
-    if os.path.exists(path):
-        pix = QPixmap(path)
-        if not pix.isNull():
-            if size is None:
-                size = BUTTON_SIZE
-            pix = pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            return QIcon(pix)
-    return None
+    If size is provided, the pixmap will be scaled to that size.
+    Scaled pixmaps are kept in QPixmapCache so repeated textures are only read and scaled once."""
+    if size is None:
+        size = BUTTON_SIZE
+    key = f"{path}@{size}"
+    pix = QPixmapCache.find(key)
+    if pix is None or pix.isNull():
+        pix = _get_raw(path)
+        if pix is None:
+            return None
+        pix = pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pix)
+    return QIcon(pix)
 
 
 # ---------------- TitleBar and custom popup reused with minor changes ----------------
 class TitleBar(QWidget):
     """Custom title bar with background texture and icon buttons."""
+    DRAG_THRESHOLD = 2
+
     def __init__(self, parent=None, title="Custom File Explorer"):
         super().__init__(parent)
         self._parent = parent
@@ -47,7 +101,12 @@ class TitleBar(QWidget):
         # Load background texture
         self.background_texture = None
         if os.path.exists(TITLEBAR_BG):
-            self.background_texture = QPixmap(TITLEBAR_BG)
+            # Convert once to the premultiplied format the raster engine paints from
+            image = QImage(TITLEBAR_BG).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            self.background_texture = QPixmap.fromImage(image)
+        # Scaled copy of the texture, rebuilt only when the title bar is resized
+        self._scaled_bg = None
+        self._scaled_size = None
         
         # Layout
         layout = QHBoxLayout()
@@ -78,7 +137,7 @@ class TitleBar(QWidget):
         layout.addWidget(self.title_label, 1)
 
         # Buttons (minimize and close same as before)
-        self.min_btn = QPushButton()
+        self.min_btn = QToolButton()
         self.min_btn.setToolTip("Minimize")
         self._style_button(self.min_btn)
         min_icon = load_icon(MINIMIZE_IMG, BUTTON_SIZE)
@@ -90,7 +149,7 @@ class TitleBar(QWidget):
         self.min_btn.clicked.connect(self.on_minimize)
         layout.addWidget(self.min_btn, 0, Qt.AlignRight)
 
-        self.close_btn = QPushButton()
+        self.close_btn = QToolButton()
         self.close_btn.setToolTip("Close")
         self._style_button(self.close_btn)
         close_icon = load_icon(CLOSE_IMG, BUTTON_SIZE)
@@ -104,20 +163,24 @@ class TitleBar(QWidget):
 
         self.setLayout(layout)
 
-        # For dragging
+        # For dragging; small moves are accumulated and applied once they reach DRAG_THRESHOLD px
         self._drag_pos = None
+        self._pending_delta = QPoint(0, 0)
 
     def paintEvent(self, event):
         """Override paintEvent to draw the background texture."""
         painter = QPainter(self)
         
         if self.background_texture and not self.background_texture.isNull():
-            # Scale the texture to fill the entire title bar
-            scaled_pixmap = self.background_texture.scaled(
-                self.width(), self.height(),
-                Qt.IgnoreAspectRatio, Qt.SmoothTransformation
-            )
-            painter.drawPixmap(0, 0, scaled_pixmap)
+            # Scale the texture to fill the entire title bar (fast scaling is
+            # indistinguishable on a 40px decorative bar)
+            if self._scaled_size != self.size():
+                self._scaled_bg = self.background_texture.scaled(
+                    self.width(), self.height(),
+                    Qt.IgnoreAspectRatio, Qt.FastTransformation
+                )
+                self._scaled_size = self.size()
+            painter.drawPixmap(0, 0, self._scaled_bg)
         else:
             # Fallback gradient if no texture
             gradient = QLinearGradient(0, 0, 0, self.height())
@@ -127,23 +190,11 @@ class TitleBar(QWidget):
         
         painter.end()
 
-    def _style_button(self, btn: QPushButton):
-        btn.setFlat(True)
+    def _style_button(self, btn: QToolButton):
+        # autoRaise gives the flat look with a native hover highlight over the texture
+        btn.setAutoRaise(True)
         btn.setFixedSize(BUTTON_SIZE + 8, BUTTON_SIZE + 8)
         btn.setCursor(Qt.PointingHandCursor)
-        
-        # Style buttons to look good over textured background
-        btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0);
-                border: 1px solid rgba(255, 255, 255, 0);
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0);
-            }
-        """)
 
     def on_minimize(self):
         if self._parent:
@@ -153,6 +204,11 @@ class TitleBar(QWidget):
         if self._parent:
             self._parent.close()
 
+    def _apply_pending_move(self):
+        if not self._pending_delta.isNull():
+            self._parent.move(self._parent.pos() + self._pending_delta)
+            self._pending_delta = QPoint(0, 0)
+
     # Enable click-and-drag to move the window
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -161,16 +217,176 @@ class TitleBar(QWidget):
 
     def mouseMoveEvent(self, event):
         if self._drag_pos is not None and self._parent:
-            delta = event.globalPos() - self._drag_pos
-            self._parent.move(self._parent.pos() + delta)
+            self._pending_delta += event.globalPos() - self._drag_pos
             self._drag_pos = event.globalPos()
+            if self._pending_delta.manhattanLength() >= self.DRAG_THRESHOLD:
+                self._apply_pending_move()
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
+        if self._drag_pos is not None and self._parent:
+            self._apply_pending_move()
         self._drag_pos = None
         super().mouseReleaseEvent(event)
 
 
+# ---------------- Filesystem helpers ----------------
+def _classify(path):
+    """Return (exists, is_dir) for path from a single stat() call."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
+
+# ---------------- Background paste ----------------
+def _fast_copy(src, dst):
+    """Drop-in for shutil.copy2 that lets the kernel move the file data where it can:
+    CopyFileExW on Windows, and shutil.copyfile elsewhere (which already uses sendfile
+    on Linux and fcopyfile on macOS, with its same-file and special-file checks).
+    Metadata is copied with shutil.copystat."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if sys.platform == "win32":
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        if not ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            raise ctypes.WinError()
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+class PasteWorker(QThread):
+    """Copies (or moves, for cut) clipboard entries into dest_dir off the GUI thread.
+    Entries are (path, is_dir) pairs; is_dir is None when the type is not known yet.
+    Transfers are overlapped on a thread pool, at most MAX_IN_FLIGHT at a time."""
+    MAX_IN_FLIGHT = 64
+
+    progress = pyqtSignal(int, int)    # items processed so far, planned jobs in total
+    completed = pyqtSignal(int, list)  # pasted count, [(src, error message)]
+
+    def __init__(self, srcs, dest_dir, is_cut=False, parent=None):
+        super().__init__(parent)
+        self.srcs = list(srcs)
+        self.dest_dir = dest_dir
+        self.is_cut = is_cut
+
+    def _plan(self):
+        """Resolve the destination of every source; returns (jobs, failed)."""
+        jobs = []
+        failed = []
+        claimed = set()  # destinations taken by earlier items of this batch
+        dest_abs = os.path.abspath(self.dest_dir)
+        dest_dir_p = Path(self.dest_dir)
+        for src, is_dir in self.srcs:
+            # entries from the model already know their type, so they only need an
+            # existence check; sources removed since Copy are skipped
+            if is_dir is None:
+                exists, is_dir = _classify(src)
+            else:
+                exists = os.path.lexists(src)
+            if not exists:
+                continue
+
+            p = Path(src)
+            base = p.name
+            dest = dest_dir_p / base
+
+            # Prevent recursive move
+            if os.path.abspath(src) == dest_abs:
+                failed.append((src, f"Cannot paste '{base}' into itself."))
+                continue
+
+            # Handle name conflicts: foo_copy.txt, then foo_copy2.txt, ... until the name is
+            # free on disk and not already taken by another job of this batch
+            n = 1
+            while dest in claimed or _classify(dest)[0]:
+                suffix = "_copy" if n == 1 else f"_copy{n}"
+                dest = dest_dir_p / f"{p.stem}{suffix}{p.suffix}"
+                n += 1
+            claimed.add(dest)
+            jobs.append((src, os.fspath(dest), is_dir))
+        return jobs, failed
+
+    def _transfer(self, src, dest, is_dir):
+        # --- CUT OPERATION - MOVE AND DELETE ORIGINAL ---
+        if self.is_cut:
+            try:
+                # First try direct move
+                shutil.move(src, dest, copy_function=_fast_copy)
+            except Exception:
+                # If direct move fails, try copy + delete as fallback
+                if is_dir:
+                    shutil.copytree(src, dest, copy_function=_fast_copy)
+                    shutil.rmtree(src)
+                else:
+                    _fast_copy(src, dest)
+                    os.remove(src)
+        # --- COPY OPERATION ---
+        else:
+            if is_dir:
+                shutil.copytree(src, dest, copy_function=_fast_copy)
+            else:
+                _fast_copy(src, dest)
+
+    def run(self):
+        jobs, failed = self._plan()
+        pasted_count = 0
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_IN_FLIGHT, len(jobs))) as pool:
+                futures = {pool.submit(self._transfer, *job): job[0] for job in jobs}
+                for done, future in enumerate(as_completed(futures), 1):
+                    src = futures[future]
+                    try:
+                        future.result()
+                        pasted_count += 1
+                    except Exception as e:
+                        if self.is_cut:
+                            failed.append((src, f"Failed to move '{os.path.basename(src)}': {e}"))
+                        else:
+                            failed.append((src, str(e)))
+                    self.progress.emit(done, len(jobs))
+        self.completed.emit(pasted_count, failed)
+
+
+class DeleteWorker(QThread):
+    """Deletes (path, is_dir) entries off the GUI thread, overlapping the removals
+    on a small thread pool (helps most on network mounts)."""
+    MAX_WORKERS = 8
+
+    progress = pyqtSignal(int)        # number of items processed so far
+    completed = pyqtSignal(int, list)  # deleted count, [(path, error message)]
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self.entries = list(entries)
+
+    @staticmethod
+    def _remove(path, is_dir):
+        if is_dir:
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+    def run(self):
+        deleted_count = 0
+        errors = []
+        if self.entries:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(self.entries))) as pool:
+                futures = {pool.submit(self._remove, *entry): entry[0] for entry in self.entries}
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        future.result()
+                        deleted_count += 1
+                    except Exception as e:
+                        errors.append((futures[future], str(e)))
+                    self.progress.emit(done)
+        self.completed.emit(deleted_count, errors)
+
+
 class CustomPopup(QWidget):
     def __init__(self):
         super().__init__()
@@ -185,6 +401,11 @@ class CustomPopup(QWidget):
         # State for cut/copy
         self._clipboard_paths = []
         self._clipboard_is_cut = False
+        self._paste_worker = None  # PasteWorker currently running, if any
+        self._delete_worker = None  # DeleteWorker currently running, if any
+        # What we last put on the system clipboard, so repeated copies can skip the round-trip
+        self._last_clipboard_paths = None
+        self._last_clipboard_cut = False
 
         self._build_ui()
 
@@ -262,8 +483,8 @@ class CustomPopup(QWidget):
 
         # Copy
         path = os.path.join(TEXTURE_DIR, buttons_info[1][0])
-        self.copy_btn = QPushButton()
-        self.copy_btn.setFlat(True)
+        self.copy_btn = QToolButton()
+        self.copy_btn.setAutoRaise(True)
         self.copy_btn.setCursor(Qt.PointingHandCursor)
         self.copy_btn.setFixedSize(button_size, button_size)
         self.copy_btn.setToolTip(buttons_info[1][1])
@@ -278,8 +499,8 @@ class CustomPopup(QWidget):
 
         # Delete
         path = os.path.join(TEXTURE_DIR, buttons_info[2][0])
-        self.delete_btn = QPushButton()
-        self.delete_btn.setFlat(True)
+        self.delete_btn = QToolButton()
+        self.delete_btn.setAutoRaise(True)
         self.delete_btn.setCursor(Qt.PointingHandCursor)
         self.delete_btn.setFixedSize(button_size, button_size)
         self.delete_btn.setToolTip(buttons_info[2][1])
@@ -294,8 +515,8 @@ class CustomPopup(QWidget):
 
         # Paste (now with button4.png)
         path = os.path.join(TEXTURE_DIR, buttons_info[3][0])
-        self.paste_btn = QPushButton()
-        self.paste_btn.setFlat(True)
+        self.paste_btn = QToolButton()
+        self.paste_btn.setAutoRaise(True)
         self.paste_btn.setCursor(Qt.PointingHandCursor)
         self.paste_btn.setFixedSize(button_size, button_size)
         self.paste_btn.setToolTip(buttons_info[3][1])
@@ -318,10 +539,18 @@ class CustomPopup(QWidget):
 
         # File system model and tree
         self.model = QFileSystemModel()
+        # Don't resolve symlink targets while populating; keep the watcher on, since
+        # paste/delete rely on it to refresh the views
+        self.model.setOption(QFileSystemModel.DontResolveSymlinks, True)
+        self.model.setOption(QFileSystemModel.DontWatchForChanges, False)
+        self.model.setFilter(QDir.AllEntries | QDir.NoDotAndDotDot)
         self.model.setRootPath(str(Path.home()))
 
         self.tree = QTreeView()
         self.tree.setModel(self.model)
+        # only the name column is used; hidden columns never ask the model for size/type/date text
+        for column in (1, 2, 3):
+            self.tree.hideColumn(column)
         self.tree.setRootIndex(self.model.index(str(Path.home())))
         self.tree.setHeaderHidden(False)
         self.tree.setAnimated(False)
@@ -333,6 +562,7 @@ class CustomPopup(QWidget):
         # Right side: list view
         self.list = QListView()
         self.list.setModel(self.model)
+        self.list.setModelColumn(0)
         self.list.setRootIndex(self.model.index(str(Path.home())))
         self.list.doubleClicked.connect(self.on_item_double_clicked)
         self.list.setSelectionMode(QListView.ExtendedSelection)
@@ -350,48 +580,21 @@ class CustomPopup(QWidget):
         content_layout.addLayout(status_row)
 
         content.setLayout(content_layout)
-        content.setStyleSheet("""
-            QWidget {
-                border: 2px solid #535353;
-                background: qlineargradient(
-                    x1: 0, y1: 0,
-                    x2: 0, y2: 1,
-                    stop: 0 #a8a8a8,   /* top color */
-                    stop: 1 #6d6d6d    /* bottom color */
-                );
-            }
-            QPushButton {
-                background: transparent;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.06); /* subtle hover highlight */
-                border-radius: 6px;
-            }
-        """)
+        content.setStyleSheet(CONTENT_CSS)
 
         v.addWidget(content, 1)
 
         self.setLayout(v)
 
         # tooltip style
-        self.setStyleSheet("""
-            QToolTip {
-                background-color: #333333;
-                color: white;
-                border: 1px solid #222222;
-                padding: 2px;
-                font-size: 11pt;
-                font-family: 'Noto Sans';
-            }
-        """)
+        self.setStyleSheet(TOOLTIP_CSS)
 
         # initialize address
         self._current_path = str(Path.home())
         self.address.setText(self._current_path)
 
-        # Keep track of history
-        self._history = [self._current_path]
+        # Keep track of history (bounded; the oldest entries drop off the left)
+        self._history = deque([self._current_path], maxlen=256)
         self._history_index = 0
 
     # ---------------- Navigation ----------------
@@ -411,7 +614,7 @@ class CustomPopup(QWidget):
             self.go_to_path(path)
 
     def go_to_path(self, path):
-        if not os.path.exists(path):
+        if not _classify(path)[0]:
             QMessageBox.warning(self, "Path not found", f"The path does not exist:\n{path}")
             return
         idx = self.model.index(path)
@@ -426,7 +629,8 @@ class CustomPopup(QWidget):
         # update history
         if self._history_index == -1 or self._history[self._history_index] != self._current_path:
             # trim forward history
-            self._history = self._history[: self._history_index + 1]
+            while len(self._history) > self._history_index + 1:
+                self._history.pop()
             self._history.append(self._current_path)
             self._history_index = len(self._history) - 1
         self.status.setText(self._current_path)
@@ -437,7 +641,7 @@ class CustomPopup(QWidget):
 
     def on_item_double_clicked(self, index: QModelIndex):
         path = self.model.filePath(index)
-        if os.path.isdir(path):
+        if _classify(path)[1]:
             self.go_to_path(path)
         else:
             # open file with default app
@@ -446,34 +650,35 @@ class CustomPopup(QWidget):
     # ---------------- Cut / Copy / Paste / Delete ----------------
     def selected_paths(self):
         selection = self.list.selectionModel().selectedIndexes()
-        paths = []
-        seen = set()
-        for idx in selection:
-            p = self.model.filePath(idx)
-            if p not in seen:
-                paths.append(p)
-                seen.add(p)
-        return paths
+        # one index per row and column is selected; keep column 0 and drop duplicates in order
+        # isDir() comes from the model's cached file info, so callers need not stat again
+        entries = [(self.model.filePath(i), self.model.isDir(i)) for i in selection if i.column() == 0]
+        return list(dict.fromkeys(entries))
 
     def on_copy(self):
-        paths = self.selected_paths()
-        if not paths:
+        entries = self.selected_paths()
+        if not entries:
             QMessageBox.information(self, "No selection", "Select files/folders to copy.")
             return
-        self._clipboard_paths = paths
+        self._clipboard_paths = entries
         self._clipboard_is_cut = False
-        self._place_paths_in_system_clipboard(paths, cut=False)
-        self.status.setText(f"Copied {len(paths)} items")
+        self._place_paths_in_system_clipboard([p for p, _ in entries], cut=False)
+        self.status.setText(f"Copied {len(entries)} items")
 
     def on_paste(self):
-        import shutil
-        from PyQt5.QtWidgets import QApplication, QMessageBox
-
         dest_dir = self._current_path
-        if not os.path.isdir(dest_dir):
+        if not _classify(dest_dir)[1]:
             QMessageBox.warning(self, "Invalid Target", "Current location is not a directory.")
             return
 
+        # one file operation at a time: a delete could remove what this paste reads or writes
+        if self._paste_worker is not None:
+            self.status.setText("A paste is already in progress")
+            return
+        if self._delete_worker is not None:
+            self.status.setText("A delete is already in progress")
+            return
+
         cb = QApplication.clipboard()
         md = cb.mimeData()
 
@@ -481,34 +686,7 @@ class CustomPopup(QWidget):
         if md and md.hasUrls():
             urls = md.urls()
             paths = [u.toLocalFile() for u in urls if u.isLocalFile()]
-
-            for src in paths:
-                try:
-                    if not os.path.exists(src):
-                        continue
-
-                    base = os.path.basename(src)
-                    dest = os.path.join(dest_dir, base)
-
-                    if os.path.abspath(src) == os.path.abspath(dest_dir):
-                        QMessageBox.warning(self, "Paste Error", f"Cannot paste '{base}' into itself.")
-                        continue
-
-                    if os.path.exists(dest):
-                        base_name, ext = os.path.splitext(base)
-                        dest = os.path.join(dest_dir, f"{base_name}_copy{ext}")
-
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dest)
-                    else:
-                        shutil.copy2(src, dest)
-
-                except Exception as e:
-                    QMessageBox.warning(self, "Paste Error", str(e))
-
-            self.status.setText(f"Pasted {len(paths)} item(s) from system clipboard")
-            root_index = self.model.setRootPath(dest_dir)
-            self.list.setRootIndex(root_index)
+            self._start_paste([(p, None) for p in paths], dest_dir, is_cut=False, from_system=True)
             return
 
         # --- INTERNAL CLIPBOARD HANDLING ---
@@ -518,65 +696,30 @@ class CustomPopup(QWidget):
 
         clipboard_paths = self._clipboard_paths.copy()
         clipboard_is_cut = getattr(self, "_clipboard_is_cut", False)
-
-        pasted_count = 0
-        failed_paths = []  # Track which files failed to move
-
-        for src in clipboard_paths:
-            try:
-                if not os.path.exists(src):
-                    continue
-
-                base = os.path.basename(src)
-                dest = os.path.join(dest_dir, base)
-
-                # Prevent recursive move
-                if os.path.abspath(src) == os.path.abspath(dest_dir):
-                    QMessageBox.warning(self, "Paste Error", f"Cannot paste '{base}' into itself.")
-                    continue
-
-                # Handle name conflicts
-                if os.path.exists(dest):
-                    base_name, ext = os.path.splitext(base)
-                    dest = os.path.join(dest_dir, f"{base_name}_copy{ext}")
-
-                # --- CUT OPERATION - MOVE AND DELETE ORIGINAL ---
-                if clipboard_is_cut:
-                    try:
-                        # First try direct move
-                        shutil.move(src, dest)
-                        pasted_count += 1
-                    except Exception as move_error:
-                        # If direct move fails, try copy + delete as fallback
-                        try:
-                            if os.path.isdir(src):
-                                shutil.copytree(src, dest)
-                                shutil.rmtree(src)
-                            else:
-                                shutil.copy2(src, dest)
-                                os.remove(src)
-                            pasted_count += 1
-                        except Exception as fallback_error:
-                            failed_paths.append((src, str(fallback_error)))
-                            QMessageBox.warning(self, "Cut/Paste Error", 
-                                            f"Failed to move '{base}': {fallback_error}")
-                # --- COPY OPERATION ---
-                else:
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dest)
-                    else:
-                        shutil.copy2(src, dest)
-                    pasted_count += 1
-
-            except Exception as e:
-                failed_paths.append((src, str(e)))
-                QMessageBox.warning(self, "Paste Error", str(e))
-
+        self._start_paste(clipboard_paths, dest_dir, is_cut=clipboard_is_cut)
+
+    def _start_paste(self, srcs, dest_dir, is_cut, from_system=False):
+        """Run the copy/move on a PasteWorker so the event loop keeps running."""
+        worker = PasteWorker(srcs, dest_dir, is_cut, self)
+        worker.progress.connect(lambda done, total: self.status.setText(f"Pasting... {done}/{total}"))
+        worker.completed.connect(partial(self._on_paste_finished, worker, from_system))
+        # only clear the busy flag once the thread has really stopped (closeEvent relies on it)
+        worker.finished.connect(lambda: setattr(self, "_paste_worker", None))
+        worker.finished.connect(worker.deleteLater)
+        self._paste_worker = worker
+        worker.start()
+
+    def _on_paste_finished(self, worker, from_system, pasted_count, failed_paths):
+        title = "Cut/Paste Error" if worker.is_cut else "Paste Error"
+        self._show_errors(title, f"{len(failed_paths)} item(s) could not be pasted.", failed_paths)
+
+        if from_system:
+            self.status.setText(f"Pasted {len(worker.srcs)} item(s) from system clipboard")
         #FIXED: Only clear clipboard for successful cut operations
-        if clipboard_is_cut:
+        elif worker.is_cut:
             if failed_paths:
                 # Some files failed, only remove successful ones from clipboard
-                successful_paths = [p for p in clipboard_paths if p not in [fp[0] for fp in failed_paths]]
+                successful_paths = [e for e in worker.srcs if e[0] not in [fp[0] for fp in failed_paths]]
                 self._clipboard_paths = successful_paths
                 self.status.setText(f"Paste partially completed ({pasted_count} item(s), {len(failed_paths)} failed)")
             else:
@@ -587,41 +730,57 @@ class CustomPopup(QWidget):
         else:
             # For copy operations, don't clear clipboard (allow multiple pastes)
             self.status.setText(f"Paste completed ({pasted_count} item(s))")
-
-        # Refresh model view
-        root_index = self.model.setRootPath(dest_dir)
-        self.list.setRootIndex(root_index)
+        # No explicit refresh: QFileSystemModel's watcher already picks up the new entries
 
     def on_delete(self):
-        paths = self.selected_paths()
-        if not paths:
+        # one file operation at a time: a running paste may still be reading or writing these paths
+        if self._paste_worker is not None:
+            self.status.setText("A paste is already in progress")
+            return
+        if self._delete_worker is not None:
+            self.status.setText("A delete is already in progress")
+            return
+        entries = self.selected_paths()
+        if not entries:
             QMessageBox.information(self, "No selection", "Select files/folders to delete.")
             return
-        ok = QMessageBox.question(self, "Delete?", f"Delete {len(paths)} items? This will permanently delete them.")
+        ok = QMessageBox.question(self, "Delete?", f"Delete {len(entries)} items? This will permanently delete them.")
         if ok != QMessageBox.StandardButton.Yes:
             return
-        for p in paths:
-            try:
-                if os.path.isdir(p):
-                    shutil.rmtree(p)
-                else:
-                    os.remove(p)
-            except Exception as e:
-                QMessageBox.warning(self, "Delete error", str(e))
-        
-        root_index = self.list.rootIndex()
-        self.model.setRootPath(self.model.rootPath())
-        self.list.setRootIndex(root_index)
-        self.status.setText(f"Deleted {len(paths)} items")
+        worker = DeleteWorker(entries, self)
+        worker.progress.connect(lambda done: self.status.setText(f"Deleting... {done}/{len(entries)}"))
+        worker.completed.connect(partial(self._on_delete_finished, worker))
+        worker.finished.connect(lambda: setattr(self, "_delete_worker", None))
+        worker.finished.connect(worker.deleteLater)
+        self._delete_worker = worker
+        worker.start()
+
+    def _on_delete_finished(self, worker, deleted_count, errors):
+        self._show_errors("Delete error", f"{len(errors)} of {len(worker.entries)} item(s) could not be deleted.", errors)
+        # the model's file watcher removes the deleted rows; no setRootPath rescan needed
+        self.status.setText(f"Deleted {deleted_count} items")
+
+    def _show_errors(self, title, summary, errors):
+        """Show one warning for a whole batch; per-item messages go in the scrollable details."""
+        if not errors:
+            return
+        box = QMessageBox(QMessageBox.Warning, title, summary, QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(f"{path}: {message}" for path, message in errors))
+        box.exec_()
 
     def _place_paths_in_system_clipboard(self, paths, cut=False):
         # Put local file URLs into system clipboard so user may paste to other apps / Explorer
         cb = QApplication.clipboard()
-        md = QMimeData()
-        urls = [QUrl.fromLocalFile(p) for p in paths]
-        md.setUrls(urls)
-        # For cut semantics some platforms use 'preferredAction' flags — we cannot guarantee cross-platform
-        cb.setMimeData(md)
+        # Skip the clipboard round-trip when the same selection is still on a clipboard we own
+        unchanged = paths == self._last_clipboard_paths and cut == self._last_clipboard_cut
+        if not (unchanged and cb.ownsClipboard()):
+            md = QMimeData()
+            urls = [QUrl.fromLocalFile(p) for p in paths]
+            md.setUrls(urls)
+            # For cut semantics some platforms use 'preferredAction' flags — we cannot guarantee cross-platform
+            cb.setMimeData(md)
+            self._last_clipboard_paths = list(paths)
+            self._last_clipboard_cut = cut
         # update status to indicate cross-app clipboard available
         if cut:
             self.status.setText("Placed items in clipboard (cut)")
@@ -629,6 +788,18 @@ class CustomPopup(QWidget):
             self.status.setText("Placed items in clipboard (copy)")
 
     # ---------------- Utilities ----------------
+    def closeEvent(self, event):
+        # Quitting would destroy the running QThread (and could leave a cut half-moved)
+        if self._paste_worker is not None:
+            self.status.setText("Wait for the paste to finish before closing")
+            event.ignore()
+            return
+        if self._delete_worker is not None:
+            self.status.setText("Wait for the delete to finish before closing")
+            event.ignore()
+            return
+        super().closeEvent(event)
+
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             self.close()
@@ -642,6 +813,7 @@ class CustomPopup(QWidget):
 # ---------------- run ----------------
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(10240)  # KB; room for every scaled texture
 
     # Ensure textures folder exists message if not
     if not os.path.isdir(TEXTURE_DIR):